@@ -0,0 +1,74 @@
+"""Import-time benchmark guarding the translator's cold-start budget.
+
+Imports the module in fresh interpreters, reports the median import time and
+fails when it exceeds the budget or when a heavy dependency is loaded eagerly.
+
+    python bench_startup.py [module] [--runs N] [--budget-ms MS]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Dependencies that must only be imported when a job actually needs them
+LAZY_MODULES = ["requests", "openai", "pptx", "reportlab", "dotenv"]
+
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure(module):
+    try:
+        result = subprocess.run(
+            [sys.executable, "-c", CHILD_SCRIPT.format(module=module)],
+            cwd=BASE_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True
+        )
+    except subprocess.CalledProcessError as exc:
+        print(f"❌ import {module} failed:\n{exc.stderr}", file=sys.stderr)
+        sys.exit(exc.returncode or 1)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", nargs="?", default="multi_improved")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float,
+                        default=float(os.getenv("STARTUP_BUDGET_MS", "100")))
+    args = parser.parse_args()
+
+    samples = []
+    eager = set()
+    for _ in range(args.runs):
+        sample = measure(args.module)
+        samples.append(sample["ms"])
+        loaded = set(sample["modules"])
+        eager.update(name for name in LAZY_MODULES if name in loaded)
+
+    median = statistics.median(samples)
+    print(f"import {args.module}: median {median:.1f} ms over {args.runs} runs "
+          f"(min {min(samples):.1f}, max {max(samples):.1f}, budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if eager:
+        print(f"❌ Eagerly imported: {', '.join(sorted(eager))}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"❌ Startup budget exceeded by {median - args.budget_ms:.1f} ms")
+        failed = True
+    if not failed:
+        print("✅ Startup within budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,31 +1,23 @@
+import json
 import os
 import shutil
 import subprocess
+import threading
 import time
 import zipfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional
 
-import requests
-from dotenv import load_dotenv
-from openai import OpenAI
-from pptx import Presentation
-from pptx.enum.text import MSO_AUTO_SIZE
-from pptx.util import Pt
-from reportlab.pdfbase.pdfmetrics import stringWidth
-
-load_dotenv('.env')
-OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-DEEPL_API_KEY = os.getenv('DEEPL_API_KEY')
+# Heavy dependencies (requests, openai, python-pptx, reportlab, dotenv) are
+# imported on first use so app.py and new workers start quickly.
 
 if os.name == "nt":
     DEFAULT_SOFFICE = "soffice.com"
 else:
     DEFAULT_SOFFICE = "soffice"
 
-LIBREOFFICE_PATH = os.getenv("LIBREOFFICE_PATH") or DEFAULT_SOFFICE
-
 ALLOWED_FORMATS = {"pptx", "pdf"}
 
 LIBREOFFICE_CONVERT_OPTIONS = {
@@ -46,14 +38,65 @@ LIBREOFFICE_FLAGS = [
     "--nocrashreport",
 ]
 
+# OpenAI multi-target batches: cap segments per request and the expected
+# reply size (source characters x target languages) to stay under the output limit
+OPENAI_BATCH_SIZE = 40
+OPENAI_BATCH_OUTPUT_CHARS = 12000
+OPENAI_BATCH_TIMEOUT = 90
+
+REQUEST_TIMEOUT = 10
+
+_env_loaded = False
+_client = None
 _libreoffice_checked = False
 _libreoffice_available = False
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+def _load_env():
+    """Load .env once, the first time a setting is needed"""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv('.env')
+        _env_loaded = True
+
+def _getenv(name, default=None):
+    _load_env()
+    return os.getenv(name, default)
+
+def _setting(name, default=None):
+    # A value assigned on the module (multi_improved.LIBREOFFICE_PATH = ...) wins
+    if name in globals():
+        return globals()[name]
+    return _getenv(name, default)
+
+def _default_api_key(service):
+    if service.lower() == "deepl":
+        return _setting('DEEPL_API_KEY')
+    if service.lower() == "openai":
+        return _setting('OPENAI_API_KEY')
+    return None
+
+def _libreoffice_path():
+    return _setting("LIBREOFFICE_PATH") or DEFAULT_SOFFICE
+
+def __getattr__(name):
+    # Settings and the OpenAI client used to be built at import time
+    global _client
+    if name in ("OPENAI_API_KEY", "DEEPL_API_KEY"):
+        return _getenv(name)
+    if name == "LIBREOFFICE_PATH":
+        return _libreoffice_path()
+    if name == "client":
+        if _client is None:
+            from openai import OpenAI
+            _client = OpenAI(api_key=_getenv('OPENAI_API_KEY'))
+        return _client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Simple text measurement using ReportLab
 def get_text_width(text, font_size, font_name="Helvetica"):
     """Get text width in points using ReportLab"""
+    from reportlab.pdfbase.pdfmetrics import stringWidth
     try:
         return stringWidth(text, font_name, font_size)
     except:
@@ -101,30 +144,62 @@ def calculate_font_size(text, max_width, current_size, min_size=9.0):
     # Apply conservative limits
     return max(new_size, final_min)
 
+def _request_google(text, target_lang="es", source_lang="auto"):
+    """Call the free Google Translate endpoint, raising on failure"""
+    import requests
+    url = "https://translate.googleapis.com/translate_a/single"
+    params = {
+        'client': 'gtx',
+        'sl': source_lang,
+        'tl': target_lang,
+        'dt': 't',
+        'q': text
+    }
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    response = requests.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    result = response.json()
+    if result and len(result) > 0 and result[0]:
+        translated_text = ''.join([item[0] for item in result[0] if item[0]])
+        return translated_text
+    return text
+
+def _request_deepl(text, target_lang="es", api_key=None):
+    """Call the DeepL API, raising on failure"""
+    import requests
+    url = "https://api-free.deepl.com/v2/translate"
+    data = {
+        'auth_key': api_key,
+        'text': text,
+        'target_lang': target_lang.upper()
+    }
+    response = requests.post(url, data=data, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    result = response.json()
+    return result['translations'][0]['text']
+
+def _request_openai(text, target_lang="es", api_key=None):
+    """Call OpenAI chat completions, raising on failure"""
+    from openai import OpenAI
+    client = OpenAI(api_key=api_key, timeout=REQUEST_TIMEOUT)
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": f"Translate to {target_lang}. Return ONLY the translation, no explanations."},
+            {"role": "user", "content": text}
+        ],
+        temperature=0.3
+    )
+    return response.choices[0].message.content.strip()
+
 def translate_with_google(text, target_lang="es", source_lang="auto"):
     """Translate text using Google Translate API (free tier)"""
     if not text.strip():
         return text
-
     try:
-        url = "https://translate.googleapis.com/translate_a/single"
-        params = {
-            'client': 'gtx',
-            'sl': source_lang,
-            'tl': target_lang,
-            'dt': 't',
-            'q': text
-        }
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, params=params, headers=headers, timeout=10)
-        response.raise_for_status()
-        result = response.json()
-        if result and len(result) > 0 and result[0]:
-            translated_text = ''.join([item[0] for item in result[0] if item[0]])
-            return translated_text
-        return text
+        return _request_google(text, target_lang, source_lang)
     except Exception as e:
         print(f"Google Translate error: {e}")
         return text
@@ -134,16 +209,7 @@ def translate_with_deepl(text, target_lang="es", api_key=None):
     if not text.strip() or not api_key:
         return text
     try:
-        url = "https://api-free.deepl.com/v2/translate"
-        data = {
-            'auth_key': api_key,
-            'text': text,
-            'target_lang': target_lang.upper()
-        }
-        response = requests.post(url, data=data, timeout=10)
-        response.raise_for_status()
-        result = response.json()
-        return result['translations'][0]['text']
+        return _request_deepl(text, target_lang, api_key)
     except Exception as e:
         print(f"DeepL error: {e}")
         return text
@@ -153,34 +219,363 @@ def translate_with_openai(text, target_lang="es", api_key=None):
     if not text.strip() or not api_key:
         return text
     try:
-        client = OpenAI(api_key=api_key)
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": f"Translate to {target_lang}. Return ONLY the translation, no explanations."},
-                {"role": "user", "content": text}
-            ],
-            temperature=0.3
-        )
-        return response.choices[0].message.content.strip()
+        return _request_openai(text, target_lang, api_key)
     except Exception as e:
         print(f"OpenAI error: {e}")
         return text
 
+def _openai_json_translate(client, segments, target_langs):
+    """Ask OpenAI for every target language of a batch in one JSON response
+
+    Transport and API errors propagate; a reply that is not valid JSON returns None.
+    """
+    lang_list = ", ".join(target_langs)
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": (
+                f"Translate every segment into each of these languages: {lang_list}. "
+                "Respond with a JSON object whose keys are exactly those language codes and whose "
+                "values are arrays of translations, in the same order and with the same length as "
+                "the input segments. Return ONLY the JSON object, no explanations."
+            )},
+            {"role": "user", "content": json.dumps({"segments": segments}, ensure_ascii=False)}
+        ],
+        temperature=0.3,
+        response_format={"type": "json_object"}
+    )
+    try:
+        return json.loads(response.choices[0].message.content)
+    except (TypeError, ValueError):
+        return None
+
+def _valid_openai_batch(payload, language, expected):
+    """Return the translation list for a language if it matches the input batch
+
+    Empty or whitespace-only entries come back as None so those segments are
+    translated individually instead of erasing the slide text.
+    """
+    if not isinstance(payload, dict):
+        return None
+    values = payload.get(language)
+    if not isinstance(values, list) or len(values) != expected:
+        return None
+    if not all(isinstance(value, str) for value in values):
+        return None
+    return [value if value.strip() else None for value in values]
+
+def _openai_batches(segments, language_count, batch_size=OPENAI_BATCH_SIZE,
+                    max_output_chars=OPENAI_BATCH_OUTPUT_CHARS):
+    """Split segments so each combined reply stays within the output budget"""
+    batch = []
+    batch_chars = 0
+    for segment in segments:
+        segment_chars = len(segment) * language_count
+        if batch and (len(batch) >= batch_size or batch_chars + segment_chars > max_output_chars):
+            yield batch
+            batch = []
+            batch_chars = 0
+        batch.append(segment)
+        batch_chars += segment_chars
+    if batch:
+        yield batch
+
+def translate_batch_with_openai(segments, target_langs, api_key=None, batch_size=OPENAI_BATCH_SIZE):
+    """Translate segments into several languages with one OpenAI call per batch
+
+    Returns {language: {source_text: translated_text}}. Languages whose combined
+    reply is malformed are retried with a single-language request. On transport
+    or API errors no further batches are sent. Segments without a usable
+    translation are left out so callers fall back to translate_text.
+    """
+    results = {language: {} for language in target_langs}
+    segments = [segment for segment in segments if segment and segment.strip()]
+    if not segments or not target_langs or not api_key:
+        return results
+
+    from openai import OpenAI
+    client = OpenAI(api_key=api_key, timeout=OPENAI_BATCH_TIMEOUT, max_retries=1)
+    try:
+        for batch in _openai_batches(segments, len(target_langs), batch_size):
+            payload = _openai_json_translate(client, batch, target_langs)
+            for language in target_langs:
+                values = _valid_openai_batch(payload, language, len(batch))
+                if values is None:
+                    # Per-language fallback when the combined reply can't be parsed
+                    values = _valid_openai_batch(
+                        _openai_json_translate(client, batch, [language]), language, len(batch)
+                    )
+                if values is None:
+                    print(f"  Warning: OpenAI batch for {language} invalid, falling back per segment")
+                    continue
+                results[language].update(
+                    (source, value) for source, value in zip(batch, values) if value is not None
+                )
+    except Exception as e:
+        print(f"OpenAI batch error: {e}. Translating remaining segments individually.")
+    return results
+
+PROVIDERS = {
+    "google": lambda text, target_lang, api_key: _request_google(text, target_lang),
+    "deepl": _request_deepl,
+    "openai": _request_openai,
+}
+
+class ProviderStats:
+    """Latency and error EWMAs plus a window of recent latencies for one provider
+
+    The error rate decays toward zero with half_life seconds of inactivity, so a
+    provider demoted after an outage is retried once the failures are old.
+    """
+
+    def __init__(self, alpha=0.2, window=100, half_life=30.0):
+        self.alpha = alpha
+        self.half_life = half_life
+        self.latency = None
+        self._error_rate = 0.0
+        self._updated = time.monotonic()
+        self.latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def _decayed_error_rate(self, now):
+        return self._error_rate * 0.5 ** ((now - self._updated) / self.half_life)
+
+    @property
+    def error_rate(self):
+        with self._lock:
+            return self._decayed_error_rate(time.monotonic())
+
+    def record(self, elapsed, ok):
+        with self._lock:
+            now = time.monotonic()
+            if self.latency is None:
+                self.latency = elapsed
+            else:
+                self.latency = self.alpha * elapsed + (1 - self.alpha) * self.latency
+            error_rate = self._decayed_error_rate(now)
+            self._error_rate = self.alpha * (0.0 if ok else 1.0) + (1 - self.alpha) * error_rate
+            self._updated = now
+            if ok:
+                self.latencies.append(elapsed)
+
+    def percentile(self, q, min_samples=20):
+        with self._lock:
+            if len(self.latencies) < min_samples:
+                return None
+            ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def score(self):
+        """Expected cost of a request: lower is healthier"""
+        latency = self.latency if self.latency is not None else 1.0
+        return latency / max(1.0 - self.error_rate, 0.05)
+
+def _is_provider_error(exc):
+    """True for failures that reflect provider health: transport errors, timeouts, 5xx
+
+    4xx responses (bad or exhausted keys, unsupported target languages) depend on
+    the caller and are not counted against the provider.
+    """
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status is None or status >= 500
+
+class ProviderRouter:
+    """Route each translation to the healthiest provider, hedging slow requests
+
+    Only the requested service is used unless failover lists other providers
+    that may receive the text (on the server's keys). If a request has not
+    answered by its hedge_percentile latency, a duplicate goes to the next
+    healthiest allowed provider, or to the same one when none is allowed, and
+    the first successful answer wins. Errors fail over to the next provider.
+
+    Each request runs on its own daemon thread, so requests that lose the race
+    never block new ones. They are counted until they finish, and no more hedges
+    are sent while max_abandoned of them are still running.
+    """
+
+    def __init__(self, hedge_percentile=0.95, default_hedge_delay=3.0,
+                 max_error_rate=0.5, max_abandoned=32, failover=()):
+        self.hedge_percentile = hedge_percentile
+        self.default_hedge_delay = default_hedge_delay
+        self.max_error_rate = max_error_rate
+        self.max_abandoned = max_abandoned
+        self.failover = [name for name in failover if name in PROVIDERS]
+        self.stats = {name: ProviderStats() for name in PROVIDERS}
+        self.abandoned = 0
+        self._lock = threading.Lock()
+
+    def _candidates(self, service, api_key):
+        keys = {name: _default_api_key(name) for name in PROVIDERS}
+        if api_key and service in keys:
+            keys[service] = api_key
+        allowed = [service] + [name for name in self.failover if name != service]
+        available = [name for name in allowed if name == "google" or keys[name]]
+
+        def health(name):
+            stats = self.stats[name]
+            return (stats.error_rate >= self.max_error_rate, name != service, stats.score())
+
+        return [(name, keys[name]) for name in sorted(available, key=health)]
+
+    def _hedge_delay(self, name):
+        delay = self.stats[name].percentile(self.hedge_percentile)
+        if delay is None:
+            return self.default_hedge_delay
+        return max(delay, 0.1)
+
+    def _call(self, name, text, target_lang, api_key):
+        start = time.monotonic()
+        try:
+            result = PROVIDERS[name](text, target_lang, api_key)
+        except Exception as e:
+            if _is_provider_error(e):
+                self.stats[name].record(time.monotonic() - start, ok=False)
+            raise
+        self.stats[name].record(time.monotonic() - start, ok=True)
+        return result
+
+    def _submit(self, name, text, target_lang, api_key):
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(self._call(name, text, target_lang, api_key))
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name=f"translate-{name}", daemon=True).start()
+        return future
+
+    def _abandon(self, future):
+        with self._lock:
+            self.abandoned += 1
+        future.add_done_callback(self._release)
+
+    def _release(self, future):
+        with self._lock:
+            self.abandoned -= 1
+
+    def _can_hedge(self):
+        with self._lock:
+            return self.abandoned < self.max_abandoned
+
+    def translate(self, text, target_lang="es", service="google", api_key=None):
+        if not text.strip():
+            return text
+
+        candidates = self._candidates(service, api_key)
+        if not candidates:
+            return text
+        primary = candidates.pop(0)
+        pending = {}
+
+        def launch(candidate):
+            name, key = candidate
+            future = self._submit(name, text, target_lang, key)
+            pending[future] = name
+            return future
+
+        primary_future = launch(primary)
+        hedged = False
+        try:
+            while pending:
+                timeout = None if hedged else self._hedge_delay(primary[0])
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    # Primary is in its latency tail: send a hedged duplicate
+                    hedged = True
+                    if not self._can_hedge():
+                        continue
+                    if candidates:
+                        launch(candidates.pop(0))
+                    elif primary_future in pending:
+                        launch(primary)
+                    continue
+                for future in done:
+                    name = pending.pop(future)
+                    try:
+                        return future.result()
+                    except Exception as e:
+                        print(f"{name} translate error: {e}")
+                        if candidates:
+                            launch(candidates.pop(0))
+        finally:
+            for future in pending:
+                self._abandon(future)
+
+        print("All translation providers failed, keeping source text.")
+        return text
+
+_router = None
+_router_lock = threading.Lock()
+
+def get_router():
+    """Return the shared provider router"""
+    global _router
+    with _router_lock:
+        if _router is None:
+            # Hedge requests slower than this latency percentile
+            _router = ProviderRouter(
+                hedge_percentile=float(_getenv("TRANSLATION_HEDGE_PERCENTILE", "0.95")),
+                default_hedge_delay=float(_getenv("TRANSLATION_HEDGE_DELAY", "3.0")),
+                # Comma-separated providers allowed to take over other services' jobs
+                failover=[name.strip().lower()
+                          for name in _getenv("TRANSLATION_FAILOVER", "").split(",") if name.strip()],
+            )
+        return _router
+
 def translate_text(text, target_lang="es", service="google", api_key=None):
     """Main translation function"""
-    if service.lower() == "deepl":
+    service = service.lower()
+    if service not in PROVIDERS:
+        print(f"Unknown service: {service}. Using Google Translate as fallback.")
+        service = "google"
+    if _getenv("TRANSLATION_ROUTER", "1").lower() not in ("0", "false", "no"):
+        return get_router().translate(text, target_lang, service, api_key)
+    if service == "deepl":
         return translate_with_deepl(text, target_lang, api_key)
-    elif service.lower() == "openai":
+    elif service == "openai":
         return translate_with_openai(text, target_lang, api_key)
-    elif service.lower() == "google":
-        return translate_with_google(text, target_lang)
-    else:
-        print(f"Unknown service: {service}. Using Google Translate as fallback.")
     return translate_with_google(text, target_lang)
 
-def translate_pptx(input_file, output_file, target_lang="es", service="google", api_key=None):
-    """Simple PowerPoint translator with smart font sizing"""
+def _collect_segments(input_file):
+    """Collect the unique run texts of a presentation in slide order"""
+    from pptx import Presentation
+    prs = Presentation(input_file)
+    segments = []
+    seen = set()
+
+    def add_runs(text_frame):
+        for paragraph in text_frame.paragraphs:
+            for run in paragraph.runs:
+                if run.text and run.text.strip() and run.text not in seen:
+                    seen.add(run.text)
+                    segments.append(run.text)
+
+    for slide in prs.slides:
+        for shape in slide.shapes:
+            if hasattr(shape, "text_frame") and shape.text_frame:
+                add_runs(shape.text_frame)
+            if hasattr(shape, 'has_table') and shape.has_table:
+                for row in shape.table.rows:
+                    for cell in row.cells:
+                        if cell.text_frame:
+                            add_runs(cell.text_frame)
+    return segments
+
+def translate_pptx(input_file, output_file, target_lang="es", service="google", api_key=None,
+                   prepared=None):
+    """Simple PowerPoint translator with smart font sizing
+
+    prepared optionally maps source run text to an already translated string;
+    runs not found there are translated individually with translate_text.
+    """
+    from pptx import Presentation
+    from pptx.enum.text import MSO_AUTO_SIZE
+    from pptx.util import Pt
+
     if not os.path.exists(input_file):
         print(f"Error: Input file '{input_file}' not found!")
         return 0
@@ -195,10 +590,8 @@ def translate_pptx(input_file, output_file, target_lang="es", service="google",
     total_translated = 0
 
     # Auto-load API keys
-    if service.lower() == "deepl" and not api_key:
-        api_key = DEEPL_API_KEY
-    elif service.lower() == "openai" and not api_key:
-        api_key = OPENAI_API_KEY
+    if not api_key:
+        api_key = _default_api_key(service)
 
     print(f"Using {service.upper()} translation service...")
 
@@ -222,14 +615,15 @@ def translate_pptx(input_file, output_file, target_lang="es", service="google",
                                 
                                 # Translate
                                 original_text = run.text
-                                translated_text = translate_text(original_text, target_lang, service, api_key)
+                                translated_text = prepared.get(original_text) if prepared else None
+                                if translated_text is None:
+                                    translated_text = translate_text(original_text, target_lang, service, api_key)
+                                    time.sleep(0.1)
                                 run.text = translated_text
                                 total_translated += 1
                                 
                                 # Collect all translated text for consistent sizing
                                 all_translated_text += translated_text + " "
-                                
-                                time.sleep(0.1)
                             except Exception as e:
                                 print(f"  Warning: Couldn't translate run text - {e}")
                 
@@ -276,14 +670,15 @@ def translate_pptx(input_file, output_file, target_lang="es", service="google",
                                             
                                             # Translate
                                             original_text = run.text
-                                            translated_text = translate_text(original_text, target_lang, service, api_key)
+                                            translated_text = prepared.get(original_text) if prepared else None
+                                            if translated_text is None:
+                                                translated_text = translate_text(original_text, target_lang, service, api_key)
+                                                time.sleep(0.1)
                                             run.text = translated_text
                                             total_translated += 1
                                             
                                             # Collect all translated text for consistent sizing
                                             all_cell_text += translated_text + " "
-                                            
-                                            time.sleep(0.1)
                                         except Exception as e:
                                             print(f"  Warning: Table cell translation failed - {e}")
                             
@@ -318,7 +713,7 @@ def _ensure_libreoffice_available():
             raise FileNotFoundError("LibreOffice (soffice) not found.")
         return
     
-    resolved = shutil.which(LIBREOFFICE_PATH)
+    resolved = shutil.which(_libreoffice_path())
     _libreoffice_checked = True
     _libreoffice_available = bool(resolved)
     if not _libreoffice_available:
@@ -359,7 +754,7 @@ def _libreoffice_convert(source_path, target_format):
     outdir = source_path.parent
     
     for convert_arg in filters:
-        cmd = [LIBREOFFICE_PATH, *LIBREOFFICE_FLAGS, "--convert-to", convert_arg, "--outdir", str(outdir), str(source_path)]
+        cmd = [_libreoffice_path(), *LIBREOFFICE_FLAGS, "--convert-to", convert_arg, "--outdir", str(outdir), str(source_path)]
         result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
         if result.returncode == 0:
             break
@@ -386,8 +781,13 @@ def _bundle_outputs_to_zip(output_root):
     return zip_path
 
 def translate_pptx_multi(input_file, target_langs, service="google", api_key=None, 
-                        formats=None, output_root=None, max_workers=None, zip_output=True):
-    """Multi-language PowerPoint translator"""
+                        formats=None, output_root=None, max_workers=None, zip_output=True,
+                        multi_target=True):
+    """Multi-language PowerPoint translator
+
+    With the OpenAI service and multi_target enabled, all target languages are
+    requested together per batch of segments instead of one call per run and language.
+    """
     input_path = Path(input_file)
     if not input_path.exists():
         raise FileNotFoundError(f"Input file '{input_path}' not found.")
@@ -400,10 +800,8 @@ def translate_pptx_multi(input_file, target_langs, service="google", api_key=Non
     if "pdf" in normalized_formats:
             _ensure_libreoffice_available()
     
-    if service.lower() == "deepl" and not api_key:
-        api_key = DEEPL_API_KEY
-    elif service.lower() == "openai" and not api_key:
-        api_key = OPENAI_API_KEY
+    if not api_key:
+        api_key = _default_api_key(service)
     
     output_root_path = _ensure_output_root(output_root, input_path)
     
@@ -412,6 +810,16 @@ def translate_pptx_multi(input_file, target_langs, service="google", api_key=Non
     translations = {}
     errors = []
     
+    prepared = {}
+    if multi_target and service.lower() == "openai" and api_key:
+        try:
+            segments = _collect_segments(str(input_path))
+            print(f"🧠 Requesting {len(segments)} segments in all languages from OPENAI...")
+            prepared = translate_batch_with_openai(segments, languages, api_key)
+        except Exception as exc:
+            errors.append(f"OpenAI multi-target batch failed: {exc}")
+            print(f"⚠️ OpenAI multi-target batch failed, translating per language: {exc}")
+    
     for language in languages:
         try:
             print(f"\n📝 Translating to {language.upper()}...")
@@ -420,7 +828,8 @@ def translate_pptx_multi(input_file, target_langs, service="google", api_key=Non
             pptx_path = lang_dir / f"{input_path.stem}_{language}.pptx"
             
             # Translate
-            translated = translate_pptx(str(input_path), str(pptx_path), language, service, api_key)
+            translated = translate_pptx(str(input_path), str(pptx_path), language, service, api_key,
+                                        prepared=prepared.get(language))
             
             outputs = {}
             if "pptx" in normalized_formats: